@@ -10,7 +10,7 @@ import signal
 from utils.arg_parser import ArgParse
 from utils.logger import LogLevel, Logger
 from utils.settings import load_settings, ensure_config_dir, save_settings
-from utils.translations import get_translations
+from utils.translations import LANGUAGES, get_translations
 
 # Initialize GTK before imports
 gi.require_version("Gtk", "3.0")
@@ -110,7 +110,7 @@ def setup_environment_and_dirs(logger):
 
 def load_language_and_translations(arg_parser, logger):
     settings = load_settings(logger)
-    available_languages = ["en", "es", "pt", "fr", "id", "it", "tr", "de", "ru"]
+    available_languages = list(LANGUAGES)
 
     if arg_parser.find_arg(("-L", "--lang")):
         lang = arg_parser.option_arg(("-L", "--lang"))
@@ -259,7 +259,7 @@ def setup_temp_directory(logger):
 
 def process_language(arg_parser, logger):
     settings = load_settings(logger)
-    available_languages = ["en", "es", "pt", "fr", "id", "it", "tr", "de", "ru"]
+    available_languages = list(LANGUAGES)
 
     if arg_parser.find_arg(("-L", "--lang")):
         lang = arg_parser.option_arg(("-L", "--lang"))
@@ -5,7 +5,7 @@ import dbus.mainloop.glib
 from gi.repository import GLib  # type: ignore
 import subprocess
 import threading
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 import time  # For proper sleep handling
 import os
 
@@ -30,7 +30,8 @@ class BluetoothManager:
         self.adapter = None
         self.adapter_path = None
         self.bus = None
-        self.audio_routing_callbacks = []
+        # Copy-on-write tuple: worker threads iterate it while the UI thread swaps it
+        self.audio_routing_callbacks: Tuple[Callable[[str], None], ...] = ()
         self.current_audio_sink = None
         self.signal_match = None
 
@@ -75,7 +76,7 @@ class BluetoothManager:
                 self.signal_match = None
             self.adapter = None
             self.bus = None
-            self.audio_routing_callbacks.clear()
+            self.audio_routing_callbacks = ()
         except Exception:
             pass  # Ignore errors during cleanup
 
@@ -547,8 +548,9 @@ def add_audio_routing_callback(callback: Callable[[str], None], logging: Logger)
         logging: Logger instance
     """
     manager = get_bluetooth_manager(logging)
-    if callback not in manager.audio_routing_callbacks:
-        manager.audio_routing_callbacks.append(callback)
+    callbacks = manager.audio_routing_callbacks
+    if callback not in callbacks:
+        manager.audio_routing_callbacks = callbacks + (callback,)
 
 def remove_audio_routing_callback(callback: Callable[[str], None], logging: Logger) -> None:
     """Remove an audio routng callback
@@ -558,8 +560,9 @@ def remove_audio_routing_callback(callback: Callable[[str], None], logging: Logg
         logging: Logger instance
     """
     manager = get_bluetooth_manager(logging)
-    if callback in manager.audio_routing_callbacks:
-        manager.audio_routing_callbacks.remove(callback)
+    callbacks = manager.audio_routing_callbacks
+    if callback in callbacks:
+        manager.audio_routing_callbacks = tuple(cb for cb in callbacks if cb != callback)
 
 def get_current_audio_sink(logging: Logger) -> Optional[str]:
     """Get the currently active audio sink name
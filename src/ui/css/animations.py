@@ -12,7 +12,19 @@ def animate_widget_show(widget, duration=200):
     style_context.add_class("animate-show")
     GLib.timeout_add(duration, lambda: style_context.remove_class("animate-show"))
 
+# Provider added to the screen by the first load_animations_css() call
+_animations_css_provider = None
+
 def load_animations_css():
+    """Parse animations.css and add it to the default screen
+
+    The stylesheet is only parsed and added once, later calls return the
+    provider from the first one.
+    """
+    global _animations_css_provider
+    if _animations_css_provider is not None:
+        return _animations_css_provider
+
     css_provider = Gtk.CssProvider()
     css_provider.load_from_path(get_animations_css_path())
 
@@ -24,7 +36,10 @@ def load_animations_css():
                 css_provider,
                 Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
             )
+            _animations_css_provider = css_provider
         else:
             print("Warning: No display available for CSS animations")
     except Exception as e:
         print(f"Warning: Could not load CSS animations: {str(e)}")
+
+    return css_provider
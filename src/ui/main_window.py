@@ -31,6 +31,18 @@ from ui.css.animations import load_animations_css  # animate_widget_show not use
 from utils.translations import Translation, get_translations
 from tools.globals import check_hardware_support
 
+# Command line flags that open a tab, the first requested tab wins
+TAB_ARGS = (
+    ("Volume", (("-V", "--volume"), ("-v", ""))),
+    ("Wi-Fi", (("-w", "--wifi"),)),
+    ("Autostart", (("-a", "--autostart"),)),
+    ("Bluetooth", (("-b", "--bluetooth"),)),
+    ("Battery", (("-B", "--battery"),)),
+    ("Display", (("-d", "--display"),)),
+    ("Power", (("-p", "--power"),)),
+    ("USBGuard", (("-u", "--usbguard"),)),
+)
+
 
 class BetterControl(Gtk.Window):
 
@@ -169,6 +181,11 @@ class BetterControl(Gtk.Window):
 
         # Store arg_parser before creating tabs
         self.arg_parser = arg_parser
+        # Tabs requested on the command line, in TAB_ARGS order
+        self.arg_tabs = [
+            tab_name for tab_name, flags in TAB_ARGS
+            if any(arg_parser.find_arg(flag) for flag in flags)
+        ]
 
         self.create_lazy_tabs()
         self.create_settings_button()
@@ -223,23 +240,9 @@ class BetterControl(Gtk.Window):
         # Determine active tab (command line args > first visible)
         active_tab = None
         # Check command line args first
-        if self.arg_parser.find_arg(("-V", "--volume")) or self.arg_parser.find_arg(("-v", "")):
-            active_tab = "Volume"
-        elif self.arg_parser.find_arg(("-w", "--wifi")):
-            active_tab = "Wi-Fi"
-        elif self.arg_parser.find_arg(("-a", "--autostart")):
-            active_tab = "Autostart"
-        elif self.arg_parser.find_arg(("-b", "--bluetooth")):
-            active_tab = "Bluetooth"
-        elif self.arg_parser.find_arg(("-B", "--battery")):
-            active_tab = "Battery"
-        elif self.arg_parser.find_arg(("-d", "--display")):
-            active_tab = "Display"
-        elif self.arg_parser.find_arg(("-p", "--power")):
-            active_tab = "Power"
-        elif self.arg_parser.find_arg(("-u", "--usbguard")):
-            active_tab = "USBGuard"
-        
+        if self.arg_tabs:
+            active_tab = self.arg_tabs[0]
+
         # If no args specified, use first visible tab
         if active_tab is None:
             visible_tabs = [name for name in tab_order if visibility.get(name, True)]
@@ -575,85 +578,14 @@ class BetterControl(Gtk.Window):
                 active_tab = None
 
             # Set active tab based on command line arguments
-            if (self.arg_parser.find_arg(("-V", "--volume")) or self.arg_parser.find_arg(("-v", ""))) and "Volume" in self.tab_pages:
-                page_num = self.tab_pages["Volume"]
-                self.logging.log(LogLevel.Info, f"Setting active tab to Volume (page {page_num})")
-                self.notebook.set_current_page(page_num)
-                active_tab = "Volume"
-                if self.minimal_mode:
-                    self.set_title(f"Better Control - Volume")
-            elif self.arg_parser.find_arg(("-w", "--wifi")) and "Wi-Fi" in self.tab_pages:
-                page_num = self.tab_pages["Wi-Fi"]
-                self.logging.log(LogLevel.Info, f"Setting active tab to Wi-Fi (page {page_num})")
-                self.notebook.set_current_page(page_num)
-                active_tab = "Wi-Fi"
-                if self.minimal_mode:
-                    self.set_title(f"Better Control - Wi-Fi")
-            elif (
-                self.arg_parser.find_arg(("-a", "--autostart"))
-                and "Autostart" in self.tab_pages
-            ):
-                page_num = self.tab_pages["Autostart"]
-                self.logging.log(LogLevel.Info, f"Setting active tab to Autostart (page {page_num})")
-                self.notebook.set_current_page(page_num)
-                active_tab = "Autostart"
-                if self.minimal_mode:
-                    translated_tab_name = self.tab_name_mapping.get("Autostart", "Autostart") if hasattr(self, 'tab_name_mapping') else "Autostart"
-                    self.set_title(f"Better Control - {translated_tab_name}")
-            elif (
-                self.arg_parser.find_arg(("-b", "--bluetooth"))
-                and "Bluetooth" in self.tab_pages
-            ):
-                page_num = self.tab_pages["Bluetooth"]
-                self.logging.log(LogLevel.Info, f"Setting active tab to Bluetooth (page {page_num})")
-                self.notebook.set_current_page(page_num)
-                active_tab = "Bluetooth"
-                if self.minimal_mode:
-                    translated_tab_name = self.tab_name_mapping.get("Bluetooth", "Bluetooth") if hasattr(self, 'tab_name_mapping') else "Bluetooth"
-                    self.set_title(f"Better Control - {translated_tab_name}")
-            elif (
-                self.arg_parser.find_arg(("-B", "--battery"))
-                and "Battery" in self.tab_pages
-            ):
-                page_num = self.tab_pages["Battery"]
-                self.logging.log(LogLevel.Info, f"Setting active tab to Battery (page {page_num})")
-                self.notebook.set_current_page(page_num)
-                active_tab = "Battery"
-                if self.minimal_mode:
-                    translated_tab_name = self.tab_name_mapping.get("Battery", "Battery") if hasattr(self, 'tab_name_mapping') else "Battery"
-                    self.set_title(f"Better Control - {translated_tab_name}")
-            elif (
-                self.arg_parser.find_arg(("-d", "--display"))
-                and "Display" in self.tab_pages
-            ):
-                page_num = self.tab_pages["Display"]
-                self.logging.log(LogLevel.Info, f"Setting active tab to Display (page {page_num})")
-                self.notebook.set_current_page(page_num)
-                active_tab = "Display"
-                if self.minimal_mode:
-                    translated_tab_name = self.tab_name_mapping.get("Display", "Display") if hasattr(self, 'tab_name_mapping') else "Display"
-                    self.set_title(f"Better Control - {translated_tab_name}")
-            elif (
-                self.arg_parser.find_arg(("-u", "--usbguard"))
-                and "USBGuard" in self.tab_pages
-            ):
-                page_num = self.tab_pages["USBGuard"]
-                self.logging.log(LogLevel.Info, f"Setting active tab to USBGuard (page {page_num})")
-                self.notebook.set_current_page(page_num)
-                active_tab = "USBGuard"
-                if self.minimal_mode:
-                    translated_tab_name = self.tab_name_mapping.get("USBGuard", "USBGuard") if hasattr(self, 'tab_name_mapping') else "USBGuard"
-                    self.set_title(f"Better Control - {translated_tab_name}")
-            elif (
-                self.arg_parser.find_arg(("-p", "--power"))
-                and "Power" in self.tab_pages
-            ):
-                page_num = self.tab_pages["Power"]
-                self.logging.log(LogLevel.Info, f"Setting active tab to Power (page {page_num})")
+            arg_tab = next((tab_name for tab_name in self.arg_tabs if tab_name in self.tab_pages), None)
+            if arg_tab is not None:
+                page_num = self.tab_pages[arg_tab]
+                self.logging.log(LogLevel.Info, f"Setting active tab to {arg_tab} (page {page_num})")
                 self.notebook.set_current_page(page_num)
-                active_tab = "Power"
+                active_tab = arg_tab
                 if self.minimal_mode:
-                    translated_tab_name = self.tab_name_mapping.get("Power", "Power") if hasattr(self, 'tab_name_mapping') else "Power"
+                    translated_tab_name = self.tab_name_mapping.get(arg_tab, arg_tab) if hasattr(self, 'tab_name_mapping') else arg_tab
                     self.set_title(f"Better Control - {translated_tab_name}")
             else:
                 # Default to first tab instead of using last active tab from settings
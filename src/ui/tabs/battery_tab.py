@@ -2,7 +2,7 @@
 
 import gi
 
-from utils.translations import English, Spanish  # type: ignore
+from utils.translations import Translation  # type: ignore
 gi.require_version('Gtk', '3.0')
 import subprocess
 import os
@@ -13,7 +13,7 @@ from utils.logger import LogLevel, Logger
 
 
 class BatteryTab(Gtk.Box):
-    def __init__(self, logging: Logger, txt: English|Spanish, parent=None):
+    def __init__(self, logging: Logger, txt: Translation, parent=None):
         Gtk.Box.__init__(self, orientation=Gtk.Orientation.VERTICAL, spacing=10)
         self.txt = txt
         self.logging = logging
@@ -3,7 +3,7 @@
 import gi  # type: ignore
 
 from utils.logger import LogLevel, Logger
-from utils.translations import English, Spanish
+from utils.translations import Translation
 
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, GLib, Gdk # type: ignore
@@ -23,7 +23,7 @@ from ui.widgets.bluetooth_device_row import BluetoothDeviceRow
 class BluetoothTab(Gtk.Box):
     """Bluetooth settings tab"""
 
-    def __init__(self, logging: Logger, txt: English|Spanish):
+    def __init__(self, logging: Logger, txt: Translation):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         self.txt = txt
         self.logging = logging
@@ -3,7 +3,7 @@
 import gi
 
 from utils.logger import LogLevel, Logger
-from utils.translations import English, Spanish, Portuguese, French  # type: ignore
+from utils.translations import Translation  # type: ignore
 
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, GObject  # type: ignore
@@ -20,7 +20,7 @@ class SettingsTab(Gtk.Box):
         'vertical-tabs-icon-only-changed': (GObject.SignalFlags.RUN_LAST, None, (bool,)),
     }
 
-    def __init__(self, logging: Logger, txt: English | Spanish | Portuguese | French):
+    def __init__(self, logging: Logger, txt: Translation):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         self.txt = txt
         self.logging = logging
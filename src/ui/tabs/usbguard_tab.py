@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 
+import shutil
 import subprocess
 import threading
 from gi.repository import Gtk, GLib , Gdk # type: ignore
 from utils.logger import LogLevel
-from utils.translations import get_translations
 
 class USBGuardTab(Gtk.Box):
     def __init__(self, logging, txt):
@@ -15,6 +15,13 @@ class USBGuardTab(Gtk.Box):
         from utils.hidden_devices import HiddenDevices
         self.hidden_devices = HiddenDevices(logging)
         self.manual_operations = set()  # Track devices being manually allowed/blocked
+        self.usbguard_path = None  # Cached once found so refreshes don't walk $PATH
+        # Status markup is built once here instead of on every device row
+        self.status_markup = {
+            "allow": f"<span foreground='green'>✓ {self.txt.allowed}</span>",
+            "block": f"<span foreground='red'>✗ {self.txt.blocked}</span>",
+            "reject": f"<span foreground='orange'>⚠ {self.txt.rejected}</span>"
+        }
         self.set_margin_start(10)
         self.set_margin_end(10)
         self.set_margin_top(10)
@@ -134,7 +141,7 @@ class USBGuardTab(Gtk.Box):
         self.manage_button.connect("clicked", self.show_manage_dialog)
         button_box.pack_start(self.manage_button, False, False, 0)
 
-        self.policy_button = Gtk.Button(label=get_translations().policy)
+        self.policy_button = Gtk.Button(label=self.txt.policy)
         self.policy_button.connect("clicked", self.show_policy_dialog)
         button_box.pack_start(self.policy_button, False, False, 0)
 
@@ -171,9 +178,9 @@ class USBGuardTab(Gtk.Box):
     def refresh_devices(self, widget):
         try:
             # First check if USBGuard is installed
-            try:
-                subprocess.run(["which", "usbguard"], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            except subprocess.CalledProcessError:
+            if self.usbguard_path is None:
+                self.usbguard_path = shutil.which("usbguard")
+            if self.usbguard_path is None:
                 self.status_label.set_markup(
                     "<span foreground='red'>"
                     "USBGuard is not installed. Please install it first."
@@ -231,7 +238,7 @@ class USBGuardTab(Gtk.Box):
                 )
 
             else:
-                error_display = get_translations().usbguard_error
+                error_display = self.txt.usbguard_error
 
             if hasattr(self.logging, 'log_error'):
                 self.logging.log_error(f"USBGuard error: {error_msg}")
@@ -243,7 +250,7 @@ class USBGuardTab(Gtk.Box):
                 self.logging.log_error("USBGuard not installed")
             else:
                 print("USBGuard not installed")
-            self.show_error(get_translations().usbguard_not_installed)
+            self.show_error(self.txt.usbguard_not_installed)
 
     # Common vendor and product mappings
     VENDOR_MAP = {
@@ -291,7 +298,7 @@ class USBGuardTab(Gtk.Box):
                 self.logging.log_info(f"Filtering out hidden device: {device_id}")
 
         if not visible_devices:
-            self.show_error(get_translations().no_devices)
+            self.show_error(self.txt.no_devices)
             return
 
         # Add new devices (only non-hidden ones)
@@ -392,11 +399,7 @@ Status: {status_text}
 
             # Status indicator
             status_label = Gtk.Label()
-            status_label.set_markup({
-                "allow": f"<span foreground='green'>✓ {get_translations().allowed}</span>",
-                "block": f"<span foreground='red'>✗ {get_translations().blocked}</span>",
-                "reject": f"<span foreground='orange'>⚠ {get_translations().rejected}</span>"
-            }.get(status.lower(), status))
+            status_label.set_markup(self.status_markup.get(status.lower(), status))
             status_label.set_halign(Gtk.Align.START)
             status_label.set_xalign(0)
             info_box.pack_start(status_label, False, False, 0)
@@ -412,7 +415,7 @@ Status: {status_text}
                 allow_btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
                 allow_icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic", Gtk.IconSize.SMALL_TOOLBAR)
                 allow_btn_box.pack_start(allow_icon, False, False, 0)
-                allow_label = Gtk.Label(label=get_translations().allow)
+                allow_label = Gtk.Label(label=self.txt.allow)
                 allow_revealer = Gtk.Revealer()
                 allow_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_RIGHT)
                 allow_revealer.set_transition_duration(150)
@@ -420,7 +423,7 @@ Status: {status_text}
                 allow_revealer.set_reveal_child(False)
                 allow_btn_box.pack_start(allow_revealer, False, False, 0)
                 allow_btn.add(allow_btn_box)
-                allow_btn.set_tooltip_text(get_translations().allow)
+                allow_btn.set_tooltip_text(self.txt.allow)
                 allow_btn.connect("clicked", self.on_allow_device, device_id)
 
                 allow_btn.set_events(Gdk.EventMask.ENTER_NOTIFY_MASK | Gdk.EventMask.LEAVE_NOTIFY_MASK)
@@ -433,7 +436,7 @@ Status: {status_text}
                 perm_allow_btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
                 perm_allow_icon = Gtk.Image.new_from_icon_name("emblem-default-symbolic", Gtk.IconSize.SMALL_TOOLBAR)
                 perm_allow_btn_box.pack_start(perm_allow_icon, False, False, 0)
-                perm_allow_label = Gtk.Label(label=get_translations().permanent_allow)
+                perm_allow_label = Gtk.Label(label=self.txt.permanent_allow)
                 perm_allow_revealer = Gtk.Revealer()
                 perm_allow_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_RIGHT)
                 perm_allow_revealer.set_transition_duration(150)
@@ -441,7 +444,7 @@ Status: {status_text}
                 perm_allow_revealer.set_reveal_child(False)
                 perm_allow_btn_box.pack_start(perm_allow_revealer, False, False, 0)
                 perm_allow_btn.add(perm_allow_btn_box)
-                perm_allow_btn.set_tooltip_text(get_translations().permanent_allow_tooltip)
+                perm_allow_btn.set_tooltip_text(self.txt.permanent_allow_tooltip)
                 perm_allow_btn.connect("clicked", self.on_permanent_allow_device, device_id)
 
                 perm_allow_btn.set_events(Gdk.EventMask.ENTER_NOTIFY_MASK | Gdk.EventMask.LEAVE_NOTIFY_MASK)
@@ -454,7 +457,7 @@ Status: {status_text}
                 block_btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
                 block_icon = Gtk.Image.new_from_icon_name("action-unavailable-symbolic", Gtk.IconSize.SMALL_TOOLBAR)
                 block_btn_box.pack_start(block_icon, False, False, 0)
-                block_label = Gtk.Label(label=get_translations().block)
+                block_label = Gtk.Label(label=self.txt.block)
                 block_revealer = Gtk.Revealer()
                 block_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_RIGHT)
                 block_revealer.set_transition_duration(150)
@@ -462,7 +465,7 @@ Status: {status_text}
                 block_revealer.set_reveal_child(False)
                 block_btn_box.pack_start(block_revealer, False, False, 0)
                 block_btn.add(block_btn_box)
-                block_btn.set_tooltip_text(get_translations().block)
+                block_btn.set_tooltip_text(self.txt.block)
                 block_btn.connect("clicked", self.on_block_device, device_id)
 
                 block_btn.set_events(Gdk.EventMask.ENTER_NOTIFY_MASK | Gdk.EventMask.LEAVE_NOTIFY_MASK)
@@ -505,7 +508,7 @@ Status: {status_text}
                 self.logging.log_error(f"Failed to allow device: {e}")
             else:
                 print(f"Failed to allow device: {e}")
-            self.show_error(get_translations().operation_failed)
+            self.show_error(self.txt.operation_failed)
 
     def on_permanent_allow_device(self, widget, device_id):
         """Handle permanently allowing a USB device by adding to policy"""
@@ -537,7 +540,7 @@ Status: {status_text}
                 self.logging.log_error(f"Failed to permanently allow device: {e}")
             else:
                 print(f"Failed to permanently allow device: {e}")
-            self.show_error(get_translations().operation_failed)
+            self.show_error(self.txt.operation_failed)
 
     def on_block_device(self, widget, device_id):
         try:
@@ -573,7 +576,7 @@ Status: {status_text}
                 self.logging.log_error(f"Failed to block device: {e}")
             else:
                 print(f"Failed to block device: {e}")
-            self.show_error(get_translations().operation_failed)
+            self.show_error(self.txt.operation_failed)
 
 
     def show_manage_dialog(self, widget):
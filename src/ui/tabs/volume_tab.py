@@ -6,7 +6,7 @@ import threading
 import time
 
 from utils.logger import LogLevel, Logger
-from utils.translations import English, Spanish
+from utils.translations import Translation
 
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, GLib  # type: ignore
@@ -41,7 +41,7 @@ from tools.volume import (
 class VolumeTab(Gtk.Box):
     """Volume settings tab"""
 
-    def __init__(self, logging: Logger, txt: English|Spanish):
+    def __init__(self, logging: Logger, txt: Translation):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         self.txt = txt
         self.logging = logging
@@ -48,6 +48,8 @@ class WiFiTab(Gtk.Box):
 
         # Track tab visibility status
         self.tab_visible = False
+        # (in_use, ssid, signal, security) -> (row, box) of the last network list
+        self.network_rows = {}
 
         if not wifi_supported:
             self.logging.log(LogLevel.Warn, "WiFi is not supported on this machine")
@@ -471,13 +473,17 @@ class WiFiTab(Gtk.Box):
                 self.networks_box.remove(child)
 
             if not networks:
+                self.network_rows = {}
                 self._show_no_networks_info()
                 return False
 
             sorted_networks = self._sort_networks(networks)
 
+            # Rows of networks that didn't change since the last scan are reused
+            previous_rows = self.network_rows
+            self.network_rows = {}
             for network in sorted_networks:
-                self._add_network_row(network)
+                self._add_network_row(network, previous_rows)
 
             self.networks_box.show_all()
 
@@ -533,7 +539,36 @@ class WiFiTab(Gtk.Box):
                 return 0
         return sorted(networks, key=get_sort_key)
 
-    def _add_network_row(self, network):
+    def _add_network_row(self, network, previous_rows=None):
+        key = (network["in_use"], network["ssid"], network["signal"], network["security"])
+        cached = previous_rows.get(key) if previous_rows else None
+
+        # Only reuse a row that isn't in the list yet and still shows the
+        # network, connect/disconnect replace its content with a spinner
+        if cached is not None and cached[0].get_parent() is None and cached[0].get_child() is cached[1]:
+            row, box = cached
+        else:
+            row, box = self._create_network_row(network)
+
+        self.network_rows[key] = (row, box)
+        self.networks_box.add(row)
+
+        def add_animation_with_delay(row_widget, index):
+            if row_widget and row_widget.get_parent() is not None:
+                row_widget.get_style_context().add_class("fade-in")
+
+                def remove_animation_class():
+                    if row_widget and row_widget.get_parent() is not None:
+                        row_widget.get_style_context().remove_class("fade-in")
+                    return False
+
+                GLib.timeout_add(350, remove_animation_class)
+            return False
+
+        index = len(self.networks_box.get_children()) - 1
+        GLib.timeout_add(30 * index, add_animation_with_delay, row, index)
+
+    def _create_network_row(self, network):
         row = Gtk.ListBoxRow()
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         box.set_margin_start(10)
@@ -558,22 +593,7 @@ class WiFiTab(Gtk.Box):
             box.pack_end(lock_icon, False, False, 0)
 
         row.add(box)
-        self.networks_box.add(row)
-
-        def add_animation_with_delay(row_widget, index):
-            if row_widget and row_widget.get_parent() is not None:
-                row_widget.get_style_context().add_class("fade-in")
-
-                def remove_animation_class():
-                    if row_widget and row_widget.get_parent() is not None:
-                        row_widget.get_style_context().remove_class("fade-in")
-                    return False
-
-                GLib.timeout_add(350, remove_animation_class)
-            return False
-
-        index = len(self.networks_box.get_children()) - 1
-        GLib.timeout_add(30 * index, add_animation_with_delay, row, index)
+        return row, box
 
     def _create_signal_icon(self, network):
         try:
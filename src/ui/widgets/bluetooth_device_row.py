@@ -2,14 +2,22 @@
 
 import gi
 
-from utils.translations import English, Spanish # type: ignore
+from utils.translations import Translation # type: ignore
 
 gi.require_version("Gtk", "3.0")
 gi.require_version("Pango", "1.0")
 from gi.repository import Gtk, Pango # type: ignore
 
+# GI enum values used by every row, resolved once at import
+_HORIZONTAL = Gtk.Orientation.HORIZONTAL
+_VERTICAL = Gtk.Orientation.VERTICAL
+_START = Gtk.Align.START
+_CENTER = Gtk.Align.CENTER
+_LARGE_TOOLBAR = Gtk.IconSize.LARGE_TOOLBAR
+_ELLIPSIZE_END = Pango.EllipsizeMode.END
+
 class BluetoothDeviceRow(Gtk.ListBoxRow):
-    def __init__(self, device, txt:English|Spanish):
+    def __init__(self, device, txt: Translation):
         super().__init__()
         self.txt = txt
         self.set_margin_top(5)
@@ -27,28 +35,27 @@ class BluetoothDeviceRow(Gtk.ListBoxRow):
         self.battery_percentage = device.get('battery', None)
 
         # Main container for the row
-        container = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        container = Gtk.Box(orientation=_HORIZONTAL, spacing=10)
         self.add(container)
 
         # Device icon based on type
-        device_icon = Gtk.Image.new_from_icon_name(self.get_icon_name_for_device(), Gtk.IconSize.LARGE_TOOLBAR)
+        device_icon = Gtk.Image.new_from_icon_name(self.get_icon_name_for_device(), _LARGE_TOOLBAR)
         container.pack_start(device_icon, False, False, 0)
 
         # Left side with device name and type
-        left_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
+        left_box = Gtk.Box(orientation=_VERTICAL, spacing=3)
 
-        name_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        name_box = Gtk.Box(orientation=_HORIZONTAL, spacing=5)
         name_label = Gtk.Label(label=self.device_name)
-        name_label.set_halign(Gtk.Align.START)
-        name_label.set_ellipsize(Pango.EllipsizeMode.END)
+        name_label.set_halign(_START)
+        name_label.set_ellipsize(_ELLIPSIZE_END)
         name_label.set_max_width_chars(20)
         if self.is_connected:
             name_label.set_markup(f"<b>{self.device_name}</b>")
-        name_status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
-        name_status_box.pack_start(name_label, False, True, 0)
+            name_status_box = Gtk.Box(orientation=_HORIZONTAL, spacing=0)
+            name_status_box.pack_start(name_label, False, True, 0)
 
-        if self.is_connected:
-            status_container = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=3)
+            status_container = Gtk.Box(orientation=_HORIZONTAL, spacing=3)
             status_container.get_style_context().add_class("device-status-container")
             
             # Connection indicator
@@ -66,21 +73,23 @@ class BluetoothDeviceRow(Gtk.ListBoxRow):
             status_container.pack_start(status_label, False, False, 0)
             
             name_status_box.pack_start(status_container, False, False, 4)
-        
-        name_box.pack_start(name_status_box, True, True, 0)
+            name_box.pack_start(name_status_box, True, True, 0)
+        else:
+            # Nothing to show next to the name, skip the wrapper box
+            name_box.pack_start(name_label, True, True, 0)
 
         left_box.pack_start(name_box, False, False, 0)
 
         # Device details box
-        details_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        details_box = Gtk.Box(orientation=_HORIZONTAL, spacing=5)
 
         type_label = Gtk.Label(label=self.get_friendly_device_type())
-        type_label.set_halign(Gtk.Align.START)
+        type_label.set_halign(_START)
         type_label.get_style_context().add_class("dim-label")
         details_box.pack_start(type_label, False, False, 0)
 
         mac_label = Gtk.Label(label=self.mac_address)
-        mac_label.set_halign(Gtk.Align.START)
+        mac_label.set_halign(_START)
         mac_label.get_style_context().add_class("dim-label")
         details_box.pack_start(mac_label, False, False, 10)
 
@@ -89,21 +98,21 @@ class BluetoothDeviceRow(Gtk.ListBoxRow):
         container.pack_start(left_box, True, True, 0)
 
         # Add connect/disconnect buttons
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        button_box = Gtk.Box(orientation=_HORIZONTAL, spacing=5)
 
         self.connect_button = Gtk.Button(label=self.txt.connect)
-        self.connect_button.set_valign(Gtk.Align.CENTER)
+        self.connect_button.set_valign(_CENTER)
         self.connect_button.set_sensitive(not self.is_connected)
         button_box.pack_end(self.connect_button, False, False, 0)
 
         self.disconnect_button = Gtk.Button(label=self.txt.disconnect)
-        self.disconnect_button.set_valign(Gtk.Align.CENTER)
+        self.disconnect_button.set_valign(_CENTER)
         self.disconnect_button.set_sensitive(self.is_connected)
         button_box.pack_end(self.disconnect_button, False, False, 0)
 
         # Adde forget button
         self.forget_button = Gtk.Button(label=self.txt.forget)
-        self.forget_button.set_valign(Gtk.Align.CENTER)
+        self.forget_button.set_valign(_CENTER)
         self.forget_button.set_sensitive(True)
         button_box.pack_end(self.forget_button, False, False, 0)
 
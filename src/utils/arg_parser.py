@@ -1,5 +1,5 @@
 from sys import stderr, stdout
-from typing import Dict, List, Optional, TextIO, Tuple
+from typing import Dict, List, Optional, Set, TextIO, Tuple
 
 from tools.terminal import term_support_color
 
@@ -43,6 +43,17 @@ class ArgParse:
             elif previous_arg_type == "long":
                 self.__args["long"].append({"option": arg})
 
+        # ? Every flag letter and long name given, so find_arg doesn't
+        # ? have to walk the argument lists on each call
+        self.__short_flags: Set[str] = set()
+        self.__long_flags: Set[str] = set()
+        for arg in self.__args["short"]:
+            if not isinstance(arg, Dict):
+                self.__short_flags.update(arg)
+        for arg in self.__args["long"]:
+            if not isinstance(arg, Dict):
+                self.__long_flags.add(arg)
+
     def find_arg(self, __arg: Tuple[str, str]) -> bool:
         """tries to find 'arg' inside the argument list
 
@@ -52,16 +63,7 @@ class ArgParse:
         Returns:
             bool: true if one of the arg is found, or false
         """
-        # ? Check for short arg
-        for arg in self.__args["short"]:
-            if not isinstance(arg, Dict) and __arg[0][1:] in arg:
-                return True
-
-        # ? Check for long arg
-        for arg in self.__args["long"]:
-            if not isinstance(arg, Dict) and __arg[1][2:] == arg:
-                return True
-        return False
+        return __arg[0][1:] in self.__short_flags or __arg[1][2:] in self.__long_flags
 
     def option_arg(self, __arg: Tuple[str, str]) -> Optional[str]:
         """tries to find and return an option from a given argument
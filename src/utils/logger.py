@@ -40,9 +40,12 @@ class LogLevel(Enum):
     Error = 0
 
 
-def get_current_time():
-    now = datetime.datetime.now()
-    ms = int((time.time() * 1000) % 1000)
+def get_current_time(timestamp: Optional[float] = None):
+    """Formats a time.time() value, or the current time, as MM:SS:mmm"""
+    if timestamp is None:
+        timestamp = time.time()
+    now = datetime.datetime.fromtimestamp(timestamp)
+    ms = int((timestamp * 1000) % 1000)
     return f"{now.minute:02}:{now.second:02}:{ms:03}"
 
 
@@ -161,13 +164,29 @@ class Logger:
 
         return redacted_message
 
-    def log(self, log_level: LogLevel, message: str):
-        """Logs messages to a stream based on user arg
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        """Checks if a message of the given level would be emitted
 
         Args:
-            log_level (LogLevel): the log level, which consists of Debug, Info, Warn, Error
-            message (str): the log message
+            log_level (LogLevel): the log level to check
+
+        Returns:
+            bool: true if the message would be written somewhere, or false
         """
+        if log_level != LogLevel.Error and self.__should_log == False:
+            return False
+
+        if self.__log_file_name != "":
+            return True
+        elif log_level == LogLevel.Warn:
+            return self.__log_level < 3
+        elif log_level == LogLevel.Info:
+            return self.__log_level < 2
+        elif log_level == LogLevel.Debug:
+            return self.__log_level < 1
+        return False
+
+    def __format(self, timestamp: float, log_level: LogLevel, message: str) -> str:
         # Redact sensitive information
         redacted_message = self.__redact_sensitive_info(message)
 
@@ -177,24 +196,36 @@ class Logger:
             else self.__labels[log_level].second
         )
 
-        fmt = f"{get_current_time()} {label} {redacted_message}"
+        return f"{get_current_time(timestamp)} {label} {redacted_message}"
 
-        self.__last_log_msg = fmt
+    def log(self, log_level: LogLevel, message: str):
+        """Logs messages to a stream based on user arg
 
-        if log_level != LogLevel.Error and self.__should_log == False:
+        Messages that would be dropped skip redaction and formatting entirely.
+
+        Args:
+            log_level (LogLevel): the log level, which consists of Debug, Info, Warn, Error
+            message (str): the log message
+        """
+        self.__last_log = (time.time(), log_level, message)
+        # Formatted on demand by get_last_log_msg for dropped messages
+        self.__last_log_msg = None
+
+        if not self.is_enabled(log_level):
             return
 
+        fmt = self.__format(*self.__last_log)
+        self.__last_log_msg = fmt
+
         if self.__log_file_name != "":
             self.__log_to_file(fmt)
             print(fmt, file=stderr)
-        elif log_level == LogLevel.Warn and self.__log_level < 3:
-            print(fmt, file=stdout)
-        elif log_level == LogLevel.Info and self.__log_level < 2:
-            print(fmt, file=stdout)
-        elif log_level == LogLevel.Debug and self.__log_level < 1:
+        else:
             print(fmt, file=stdout)
 
     def get_last_log_msg(self) -> str:
+        if self.__last_log_msg is None:
+            self.__last_log_msg = self.__format(*self.__last_log)
         return self.__last_log_msg
 
     def __log_to_file(self, message: str):